@@ -3,14 +3,33 @@ OffGridFlow AI Evaluation Framework
 
 This script evaluates AI responses from the carbon emissions platform using:
 - Relevance: How well responses address carbon accounting queries
-- Coherence: Logical structure and clarity of responses  
+- Coherence: Logical structure and clarity of responses
 - Groundedness: Factual accuracy based on emission data
+
+The three judges are independent LLM calls, so each row is scored by running
+them concurrently with asyncio.gather instead of one blocking evaluate() call.
 """
 
+import argparse
+import asyncio
+import functools
+import hashlib
+import itertools
+import io
 import os
 import json
+import random
+import time
+import numpy as np
+
+# orjson's native parser is 2-5x faster than stdlib json on the small,
+# numerous JSONL records in the dataset hot path; fall back when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from azure.ai.evaluation import (
-    evaluate,
     RelevanceEvaluator,
     CoherenceEvaluator,
     GroundednessEvaluator,
@@ -20,52 +39,556 @@ from azure.ai.evaluation import (
 def load_dataset(queries_path: str, responses_path: str, output_path: str) -> str:
     """
     Combine queries and responses into evaluation dataset format.
-    
+
     Args:
         queries_path: Path to test queries JSONL file
         responses_path: Path to test responses JSONL file
         output_path: Path to save combined dataset
-        
+
     Returns:
         Path to combined dataset
+
+    Raises:
+        ValueError: If the two input files have different row counts —
+            zip() would silently truncate and misalign every judge score.
     """
-    queries = []
-    responses = []
-    
-    with open(queries_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            queries.append(json.loads(line))
-    
-    with open(responses_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            responses.append(json.loads(line))
-    
-    # Combine into evaluation format
-    combined = []
-    for q, r in zip(queries, responses):
-        combined.append({
-            "query": q["query"],
-            "response": r["response"],
-            "context": r["response"]  # Using response as context for groundedness
-        })
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        for item in combined:
-            f.write(json.dumps(item) + '\n')
-    
+    # Sentinel marking the shorter file running out under zip_longest
+    missing = object()
+
+    def check_aligned(q_line, r_line):
+        if q_line is missing or r_line is missing:
+            raise ValueError(
+                f"Row count mismatch between {queries_path} and {responses_path}; "
+                "refusing to build a misaligned evaluation dataset"
+            )
+
+    # Stream both inputs line-by-line straight into the output file so peak
+    # memory stays O(1) regardless of corpus size
+    if orjson is not None:
+        # Binary mode end to end: no per-line unicode decode/re-encode
+        with open(queries_path, 'rb') as qf, \
+             open(responses_path, 'rb') as rf, \
+             open(output_path, 'wb') as of:
+            for q_line, r_line in itertools.zip_longest(qf, rf, fillvalue=missing):
+                check_aligned(q_line, r_line)
+                q = orjson.loads(q_line)
+                r = orjson.loads(r_line)
+                item = {"query": q["query"], "response": r["response"]}
+                # Real retrieval context only — grounding against the response
+                # itself makes the groundedness score tautological
+                context = r.get("context") or r.get("retrieval_context")
+                if context:
+                    item["context"] = context
+                of.write(orjson.dumps(item))
+                of.write(b'\n')
+        return output_path
+
+    with open(queries_path, 'r', encoding='utf-8') as qf, \
+         open(responses_path, 'r', encoding='utf-8') as rf, \
+         open(output_path, 'w', encoding='utf-8') as of:
+        for q_line, r_line in itertools.zip_longest(qf, rf, fillvalue=missing):
+            check_aligned(q_line, r_line)
+            q = json.loads(q_line)
+            r = json.loads(r_line)
+            item = {"query": q["query"], "response": r["response"]}
+            context = r.get("context") or r.get("retrieval_context")
+            if context:
+                item["context"] = context
+            of.write(json.dumps(item))
+            of.write('\n')
+
     return output_path
 
-def main():
-    """Run comprehensive evaluation of OffGridFlow AI responses."""
-    
-    # Configure OpenAI model for evaluation (uses environment variable)
-    # Set OPENAI_API_KEY environment variable before running
-    model_config = OpenAIModelConfiguration(
+class RateLimiter:
+    """
+    Sliding-window requests-per-minute / tokens-per-minute throttle.
+
+    Follows the OpenAI cookbook api_request_parallel_processor pattern:
+    before each judge request, acquire() records the request against a
+    60-second window and sleeps while either the RPM or TPM budget is
+    exhausted. Token usage is estimated from prompt character counts.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._events = []  # (timestamp, estimated_tokens)
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, estimated_tokens: int):
+        """Block until the request fits within both per-minute budgets."""
+        # A single row larger than the whole TPM budget could never fit
+        # even in an empty window, so the wait loop would spin forever;
+        # clamp the estimate and let it occupy one full window instead
+        estimated_tokens = min(estimated_tokens, self.tokens_per_minute)
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._events = [(t, tok) for t, tok in self._events if now - t < 60]
+                if (len(self._events) < self.requests_per_minute and
+                        sum(tok for _, tok in self._events) + estimated_tokens <= self.tokens_per_minute):
+                    self._events.append((now, estimated_tokens))
+                    return
+                # Sleep until the oldest event ages out of the window
+                wait = 60 - (now - self._events[0][0]) if self._events else 1.0
+            await asyncio.sleep(max(wait, 0.1))
+
+# Model config and evaluators are lazy singletons: a long-running caller
+# (e.g. webhook-driven re-scoring) reuses the OpenAI client's connection
+# pool and tokenizer caches instead of rebuilding them per invocation
+@functools.lru_cache(maxsize=1)
+def get_model_config() -> OpenAIModelConfiguration:
+    """Judge model configuration from environment (built once per process)."""
+    return OpenAIModelConfiguration(
         type="openai",
         model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),  # Default to gpt-4o-mini
         api_key=os.environ.get("OPENAI_API_KEY")
     )
-    
+
+@functools.lru_cache(maxsize=1)
+def get_evaluators() -> dict:
+    """The three SDK evaluators, constructed once and reused across runs."""
+    model_config = get_model_config()
+    return {
+        "relevance": RelevanceEvaluator(model_config=model_config),
+        "coherence": CoherenceEvaluator(model_config=model_config),
+        "groundedness": GroundednessEvaluator(model_config=model_config)
+    }
+
+# Single prompt scoring all three metrics at once: the (query, response)
+# prefix is prefilled once instead of three times, cutting judge input
+# tokens by roughly two thirds versus three independent evaluator calls
+COMBINED_JUDGE_PROMPT = (
+    "You are evaluating an AI assistant for a carbon emissions platform.\n"
+    "Rate the response from 1 (poor) to 5 (excellent) on each dimension:\n"
+    "- relevance: how well the response addresses the query\n"
+    "- coherence: logical structure and clarity\n"
+    "- groundedness: how well the response is supported by the context\n\n"
+    "Query: {query}\n\nResponse: {response}\n\nContext: {context}\n\n"
+    'Return only JSON: {{"relevance": <int>, "coherence": <int>, "groundedness": <int>}}'
+)
+
+class CombinedEvaluator:
+    """
+    Scores relevance, coherence and groundedness with one judge request.
+
+    Drop-in alternative to the three SDK evaluators for throughput-sensitive
+    runs: one request per row instead of three, and the shared prompt prefix
+    is prefilled once.
+    """
+
+    def __init__(self, model: str):
+        self.model = model
+        self._client = None
+
+    def __call__(self, *, query: str, response: str, context: str) -> dict:
+        from openai import OpenAI
+        if self._client is None:
+            self._client = OpenAI()
+        completion = self._client.chat.completions.create(
+            model=self.model,
+            messages=[{
+                "role": "user",
+                "content": COMBINED_JUDGE_PROMPT.format(query=query, response=response, context=context)
+            }],
+            temperature=0,
+            response_format={"type": "json_object"}
+        )
+        scores = json.loads(completion.choices[0].message.content)
+        return {metric: float(scores[metric])
+                for metric in ("relevance", "coherence", "groundedness") if metric in scores}
+
+# Judge responses are cached on disk so iterative re-runs over an unchanged
+# dataset cost a file read instead of an API call per (row, metric)
+CACHE_DIR = ".offgridflow_cache"
+
+def _cache_path(model: str, metric: str, row: dict) -> str:
+    """Cache file path keyed by SHA-256 of (model, metric, query, response, context)."""
+    key = hashlib.sha256(
+        f"{model}|{metric}|{row.get('query', '')}|{row.get('response', '')}|{row.get('context', '')}"
+        .encode('utf-8')
+    ).hexdigest()
+    return os.path.join(CACHE_DIR, key[:2], f"{key}.json")
+
+# Transient API failures worth retrying; fall back to builtins when the
+# openai package is not installed (it ships the concrete error types)
+try:
+    from openai import APIConnectionError, APITimeoutError, RateLimitError
+    TRANSIENT_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError)
+except ImportError:
+    TRANSIENT_ERRORS = (ConnectionError, TimeoutError)
+
+async def with_retry(attempt, max_attempts: int = 5):
+    """
+    Run an async judge call, retrying transient failures with backoff.
+
+    A single 429/503 no longer aborts the whole run: each attempt backs off
+    exponentially (capped at 60s) with jitter before retrying, re-raising
+    only after max_attempts.
+
+    Args:
+        attempt: Zero-argument coroutine function performing the call
+        max_attempts: Total tries before the error propagates
+    """
+    for n in range(max_attempts):
+        try:
+            return await attempt()
+        except TRANSIENT_ERRORS:
+            if n == max_attempts - 1:
+                raise
+            await asyncio.sleep(min(60, 2 ** n + random.random()))
+
+def estimate_tokens(row: dict) -> int:
+    """Rough token estimate for one judge call (~4 chars per token)."""
+    return (len(row.get("query", "")) + len(row.get("response", "")) + len(row.get("context", ""))) // 4 + 1
+
+async def score_row(row: dict, evaluators: dict, semaphore: asyncio.Semaphore,
+                    limiter: RateLimiter, model: str, use_cache: bool = True) -> dict:
+    """
+    Score a single dataset row with all three judges concurrently.
+
+    The evaluators expose a synchronous __call__, so each judge runs in a
+    worker thread via asyncio.to_thread and the three calls overlap — per-row
+    latency is ~1x judge round trip instead of 3x.
+
+    Args:
+        row: Dataset row with query, response and context fields
+        evaluators: Mapping of metric name to evaluator instance
+        semaphore: Bounds the number of rows in flight at once
+        limiter: Shared RPM/TPM throttle applied before each judge request
+        model: Judge model name, part of the cache key so upgrades invalidate
+        use_cache: Serve judge responses from the on-disk cache when present
+
+    Returns:
+        Row dict merged with namespaced metric scores (e.g. relevance.relevance)
+    """
+    tokens = estimate_tokens(row)
+
+    async def call_judge(metric, evaluator, **kwargs):
+        cache_path = _cache_path(model, metric, row)
+        if use_cache and os.path.exists(cache_path):
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        async def attempt():
+            await limiter.acquire(tokens)
+            return await asyncio.to_thread(evaluator, **kwargs)
+
+        scores = await with_retry(attempt)
+        if use_cache:
+            # Write via tmp + os.replace so concurrent readers never see a
+            # partially written cache entry
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(scores, f)
+            os.replace(tmp_path, cache_path)
+        return scores
+
+    if "combined" in evaluators:
+        # One request covers all three metrics
+        async with semaphore:
+            scores = await call_judge("combined", evaluators["combined"],
+                                      query=row["query"], response=row["response"],
+                                      context=row.get("context", ""))
+        result = dict(row)
+        for metric, value in scores.items():
+            result[f"{metric}.{metric}"] = value
+        return result
+
+    names = ["relevance", "coherence"]
+    tasks = [
+        call_judge("relevance", evaluators["relevance"], query=row["query"], response=row["response"]),
+        call_judge("coherence", evaluators["coherence"], query=row["query"], response=row["response"]),
+    ]
+    # Groundedness only makes sense against real retrieval context
+    if "groundedness" in evaluators and row.get("context"):
+        names.append("groundedness")
+        tasks.append(call_judge("groundedness", evaluators["groundedness"],
+                                response=row["response"], context=row["context"]))
+
+    async with semaphore:
+        all_scores = await asyncio.gather(*tasks)
+
+    result = dict(row)
+    for metric, scores in zip(names, all_scores):
+        for key, value in scores.items():
+            result[f"{metric}.{key}"] = value
+    return result
+
+# Judge prompts for the Batch API path, mirroring the three SDK evaluators.
+# Each asks for a single 1-5 integer so the output file parses trivially.
+BATCH_JUDGE_PROMPTS = {
+    "relevance": (
+        "You are evaluating an AI assistant for a carbon emissions platform.\n"
+        "Rate from 1 (poor) to 5 (excellent) how well the response addresses the query.\n\n"
+        "Query: {query}\n\nResponse: {response}\n\n"
+        "Return only the integer score."
+    ),
+    "coherence": (
+        "You are evaluating an AI assistant for a carbon emissions platform.\n"
+        "Rate from 1 (poor) to 5 (excellent) the logical structure and clarity of the response.\n\n"
+        "Query: {query}\n\nResponse: {response}\n\n"
+        "Return only the integer score."
+    ),
+    "groundedness": (
+        "You are evaluating an AI assistant for a carbon emissions platform.\n"
+        "Rate from 1 (poor) to 5 (excellent) how well the response is grounded in the context.\n\n"
+        "Context: {context}\n\nResponse: {response}\n\n"
+        "Return only the integer score."
+    ),
+}
+
+def run_batch_evaluation(dataset_path: str, model: str, output_dir: str = "evaluation_results") -> dict:
+    """
+    Evaluate the dataset offline through the OpenAI Batch API.
+
+    Every (row, metric) pair becomes one /v1/chat/completions request in a
+    batch input file. Batch runs cost ~50% of synchronous requests and are
+    not subject to interactive rate limits, at the price of latency — suited
+    to nightly regression runs, not interactive use.
+
+    Args:
+        dataset_path: Path to combined evaluation dataset JSONL
+        model: Judge model name
+        output_dir: Directory for result files
+
+    Returns:
+        Result dict with "rows" and "metrics" keys
+    """
+    from openai import OpenAI
+
+    with open(dataset_path, 'r', encoding='utf-8') as f:
+        rows = [json.loads(line) for line in f]
+
+    # One request per (row, metric), keyed so results can be re-joined
+    request_lines = []
+    for idx, row in enumerate(rows):
+        for metric, template in BATCH_JUDGE_PROMPTS.items():
+            if metric == "groundedness" and not row.get("context"):
+                continue  # no retrieval context to ground against
+            request_lines.append(json.dumps({
+                "custom_id": f"{idx}:{metric}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [{"role": "user", "content": template.format(**row)}],
+                    "temperature": 0
+                }
+            }))
+
+    client = OpenAI()
+
+    print(f"📤 Uploading batch input ({len(request_lines)} requests)...")
+    batch_file = client.files.create(
+        file=io.BytesIO('\n'.join(request_lines).encode('utf-8')),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    print(f"✅ Batch submitted: {batch.id}")
+
+    # Poll until the batch reaches a terminal state
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        print(f"   Batch {batch.id} status: {batch.status}...")
+        time.sleep(30)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+    output = client.files.content(batch.output_file_id).text
+
+    scored = [dict(row) for row in rows]
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        idx_str, metric = entry["custom_id"].split(':', 1)
+        content = entry["response"]["body"]["choices"][0]["message"]["content"]
+        try:
+            score = float(content.strip())
+        except ValueError:
+            score = None
+        scored[int(idx_str)][f"{metric}.{metric}"] = score
+
+    metrics = aggregate_metrics(scored)
+    write_results(scored, metrics, output_dir)
+    return {"rows": scored, "metrics": metrics}
+
+def dataset_has_context(dataset_path: str) -> bool:
+    """True if any dataset row carries retrieval context for groundedness."""
+    with open(dataset_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip() and json.loads(line).get("context"):
+                return True
+    return False
+
+def row_hash(row: dict) -> str:
+    """Stable hash of a dataset row's input fields, used for resume."""
+    payload = {k: row[k] for k in ("query", "response", "context") if k in row}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+
+def load_checkpoint(output_dir: str) -> dict:
+    """
+    Map previously scored rows by their row_hash.
+
+    Reads both the final results file and the crash checkpoint, so a rerun
+    after a mid-run failure (or over an unchanged dataset) only dispatches
+    rows that were never scored.
+    """
+    done = {}
+    for name in ("evaluation_results.jsonl", "evaluation_results.partial.jsonl"):
+        path = os.path.join(output_dir, name)
+        if not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # truncated write from a crash
+                if row.get("row_hash"):
+                    done[row["row_hash"]] = row
+    return done
+
+def aggregate_metrics(rows: list) -> dict:
+    """Average the numeric per-row scores into overall metrics (vectorized)."""
+    values = {}
+    for row in rows:
+        for key, value in row.items():
+            if '.' in key and isinstance(value, (int, float)):
+                values.setdefault(key, []).append(value)
+    return {key: float(np.asarray(vals, dtype=np.float32).mean())
+            for key, vals in values.items()}
+
+def metric_stats(rows: list, metric_key: str) -> dict:
+    """
+    Vectorized distribution stats for one metric across all scored rows.
+
+    One NumPy reduction replaces a Python-level loop of dict lookups and
+    float adds — milliseconds instead of seconds on 100k-row runs.
+
+    Returns:
+        Dict with mean/std/p50/p95/p99, or None when no rows carry the metric
+    """
+    scores = np.fromiter(
+        (row[metric_key] for row in rows if isinstance(row.get(metric_key), (int, float))),
+        dtype=np.float32
+    )
+    if scores.size == 0:
+        return None
+    p50, p95, p99 = np.percentile(scores, [50, 95, 99])
+    return {
+        "mean": float(scores.mean()),
+        "std": float(scores.std()),
+        "p50": float(p50),
+        "p95": float(p95),
+        "p99": float(p99),
+    }
+
+def write_results(scored: list, metrics: dict, output_dir: str):
+    """Write row-level scores and aggregate metrics to the output directory."""
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "evaluation_results.jsonl"), 'w', encoding='utf-8') as f:
+        for row in scored:
+            f.write(json.dumps(row) + '\n')
+    with open(os.path.join(output_dir, "evaluation_results_metrics.json"), 'w', encoding='utf-8') as f:
+        json.dump(metrics, f, indent=2)
+
+async def run_evaluation(dataset_path: str, evaluators: dict, model: str,
+                         output_dir: str = "evaluation_results", use_cache: bool = True) -> dict:
+    """
+    Evaluate every dataset row, writing row-level scores and aggregate metrics.
+
+    Args:
+        dataset_path: Path to combined evaluation dataset JSONL
+        evaluators: Mapping of metric name to evaluator instance
+        model: Judge model name (used in the judge-response cache key)
+        output_dir: Directory for result files
+        use_cache: Serve judge responses from the on-disk cache when present
+
+    Returns:
+        Result dict with "rows" and "metrics" keys
+    """
+    # Producer/consumer pipeline: the producer streams rows off disk into a
+    # bounded queue while EVAL_CONCURRENCY consumers score them, overlapping
+    # file I/O and JSON decode with judge round trips
+    max_concurrent = int(os.getenv("EVAL_CONCURRENCY", "10"))
+    semaphore = asyncio.Semaphore(max_concurrent)
+    limiter = RateLimiter(
+        requests_per_minute=int(os.getenv("EVAL_RPM", "500")),
+        tokens_per_minute=int(os.getenv("EVAL_TPM", "200000"))
+    )
+
+    # Persist each row as it completes so a crash loses at most in-flight work
+    os.makedirs(output_dir, exist_ok=True)
+    partial_path = os.path.join(output_dir, "evaluation_results.partial.jsonl")
+    write_lock = asyncio.Lock()
+
+    # Skip rows already scored by a previous (possibly crashed) run
+    done = load_checkpoint(output_dir)
+    if done:
+        print(f"   Resuming: {len(done)} checkpointed rows will be reused")
+
+    queue = asyncio.Queue(maxsize=max_concurrent * 2)
+    hashes = []  # dataset order, filled by the producer
+    results = {}  # row_hash -> scored row
+
+    async def producer():
+        loads = orjson.loads if orjson is not None else json.loads
+        mode = 'rb' if orjson is not None else 'r'
+        with open(dataset_path, mode) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                row = loads(line)
+                h = row_hash(row)
+                hashes.append(h)
+                if h in done:
+                    results[h] = done[h]
+                    continue
+                await queue.put((row, h))
+        for _ in range(max_concurrent):
+            await queue.put(None)  # one sentinel per consumer
+
+    async def consumer():
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            row, h = item
+            scored_row = await score_row(row, evaluators, semaphore, limiter, model, use_cache)
+            scored_row["row_hash"] = h
+            async with write_lock:
+                with open(partial_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(scored_row) + '\n')
+            results[h] = scored_row
+
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(producer())
+        for _ in range(max_concurrent):
+            tg.create_task(consumer())
+
+    # Reassemble results in dataset order, mixing checkpointed and fresh rows
+    scored = [results[h] for h in hashes]
+
+    metrics = aggregate_metrics(scored)
+    write_results(scored, metrics, output_dir)
+    # Full results are on disk; the crash checkpoint is no longer needed
+    if os.path.exists(partial_path):
+        os.remove(partial_path)
+    return {"rows": scored, "metrics": metrics}
+
+def main(batch: bool = False, use_cache: bool = True, combined_judge: bool = False):
+    """Run comprehensive evaluation of OffGridFlow AI responses."""
+
+    # Judge model for evaluation (set OPENAI_API_KEY before running)
+    model = get_model_config()["model"]
+
     # Prepare dataset
     print("📊 Preparing evaluation dataset...")
     dataset_path = load_dataset(
@@ -74,79 +597,81 @@ def main():
         output_path="evaluation_dataset.jsonl"
     )
     print(f"✅ Dataset ready: {dataset_path}")
-    
-    # Initialize evaluators
-    print("\n🔧 Initializing evaluators...")
-    relevance_eval = RelevanceEvaluator(model_config=model_config)
-    coherence_eval = CoherenceEvaluator(model_config=model_config)
-    groundedness_eval = GroundednessEvaluator(model_config=model_config)
-    print("✅ Evaluators initialized")
-    
-    # Run evaluation
-    print("\n🚀 Running evaluation...")
-    print("   This may take a few minutes...\n")
-    
-    result = evaluate(
-        data=dataset_path,
-        evaluators={
-            "relevance": relevance_eval,
-            "coherence": coherence_eval,
-            "groundedness": groundedness_eval
-        },
-        evaluator_config={
-            "relevance": {
-                "column_mapping": {
-                    "query": "${data.query}",
-                    "response": "${data.response}"
-                }
-            },
-            "coherence": {
-                "column_mapping": {
-                    "query": "${data.query}",
-                    "response": "${data.response}"
-                }
-            },
-            "groundedness": {
-                "column_mapping": {
-                    "response": "${data.response}",
-                    "context": "${data.context}"
-                }
-            }
-        },
-        output_path="evaluation_results"
-    )
-    
+
+    if batch:
+        # Offline path: submit everything through the Batch API
+        print("\n🚀 Running batch evaluation (may take up to 24h)...\n")
+        result = run_batch_evaluation(dataset_path, model)
+    elif combined_judge:
+        print("\n🔧 Initializing combined judge...")
+        evaluators = {"combined": CombinedEvaluator(model)}
+        print("✅ Combined judge initialized")
+
+        print("\n🚀 Running evaluation (one judge call per row)...\n")
+        result = asyncio.run(run_evaluation(dataset_path, evaluators, model, use_cache=use_cache))
+    else:
+        # Initialize evaluators (cached across invocations in-process)
+        print("\n🔧 Initializing evaluators...")
+        evaluators = get_evaluators()
+        if not dataset_has_context(dataset_path):
+            # Without real retrieval context the groundedness judge would only
+            # measure the response against itself — skip it and save the calls
+            print("⚠️  No retrieval context in responses; skipping groundedness evaluator")
+            evaluators = {k: v for k, v in evaluators.items() if k != "groundedness"}
+        print("✅ Evaluators initialized")
+
+        # Run evaluation
+        print("\n🚀 Running evaluation...")
+        print("   This may take a few minutes...\n")
+
+        result = asyncio.run(run_evaluation(dataset_path, evaluators, model, use_cache=use_cache))
+
     # Display results
     print("\n" + "="*60)
     print("📊 EVALUATION RESULTS")
     print("="*60)
-    
-    if "metrics" in result:
-        metrics = result["metrics"]
+
+    if "rows" in result:
         print(f"\n🎯 Overall Metrics:")
-        print(f"   Relevance Score:    {metrics.get('relevance.relevance', 'N/A')}")
-        print(f"   Coherence Score:    {metrics.get('coherence.coherence', 'N/A')}")
-        print(f"   Groundedness Score: {metrics.get('groundedness.groundedness', 'N/A')}")
-    
+        for label, key in (("Relevance Score:   ", "relevance.relevance"),
+                           ("Coherence Score:   ", "coherence.coherence"),
+                           ("Groundedness Score:", "groundedness.groundedness")):
+            stats = metric_stats(result["rows"], key)
+            if stats:
+                print(f"   {label} {stats['mean']:.2f}  "
+                      f"(std {stats['std']:.2f}, p50 {stats['p50']:.1f}, "
+                      f"p95 {stats['p95']:.1f}, p99 {stats['p99']:.1f})")
+            else:
+                print(f"   {label} N/A")
+
     print(f"\n💾 Detailed results saved to: evaluation_results/")
     print(f"   - evaluation_results.jsonl (row-level scores)")
     print(f"   - evaluation_results_metrics.json (aggregate metrics)")
-    
+
     print("\n✅ Evaluation complete!")
     print("="*60)
-    
+
     return result
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Evaluate OffGridFlow AI responses")
+    parser.add_argument("--batch", action="store_true",
+                        help="Submit via the OpenAI Batch API (~50%% cost, up to 24h latency)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk judge response cache")
+    parser.add_argument("--combined-judge", action="store_true",
+                        help="Score all three metrics with one judge call per row")
+    args = parser.parse_args()
+
     # Ensure we're in the evaluation directory
     script_dir = os.path.dirname(os.path.abspath(__file__))
     os.chdir(script_dir)
-    
+
     # Check for API key
     if not os.environ.get("OPENAI_API_KEY"):
         print("⚠️  Warning: OPENAI_API_KEY environment variable not set")
         print("   Set it with: $env:OPENAI_API_KEY='your-key-here' (PowerShell)")
         print("   Or use Azure OpenAI by modifying model_config in the script")
         exit(1)
-    
-    main()
+
+    main(batch=args.batch, use_cache=not args.no_cache, combined_judge=args.combined_judge)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Consolidated fix for emissions_handler.go - handle all records correctly
+
+Merges fix_emissions_handler_final.py and fix_emissions_complete.py, which
+each read and rewrote the same file independently. The file is now read
+once, piped through the transform steps as pure functions in memory, and
+written once.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+
+TARGET = Path('internal/api/http/handlers/emissions_handler.go')
+
+# Hash of the target as of the last applied run; lets repeat invocations
+# (e.g. CI) skip the whole rewrite with a single hash check
+STAMP = Path('.fix_handlers.stamp')
+
+def content_hash(data: bytes) -> str:
+    """blake2b digest of the file content (faster than sha256 on large files)."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+# Step 1: EmissionsHandler struct — expand the single calculator field
+STRUCT_FIELD_RE = re.compile(r'^\tcalculator    \*emissions\.Scope2Calculator$', re.M)
+STRUCT_FIELD_REPL = (
+    '\tscope1Calculator *emissions.Scope1Calculator\n'
+    '\tscope2Calculator *emissions.Scope2Calculator\n'
+    '\tscope3Calculator *emissions.Scope3Calculator'
+)
+
+# Step 2: EmissionsHandlerConfig — expand the single calculator field. The
+# replacement keeps the matched line, so the lookbehind stops a re-run from
+# expanding the already-expanded block again
+CONFIG_FIELD_RE = re.compile(
+    r'^(?<!Scope1Calculator \*emissions\.Scope1Calculator\n)'
+    r'\tScope2Calculator \*emissions\.Scope2Calculator$',
+    re.M
+)
+CONFIG_FIELD_REPL = (
+    '\tScope1Calculator *emissions.Scope1Calculator\n'
+    '\tScope2Calculator *emissions.Scope2Calculator\n'
+    '\tScope3Calculator *emissions.Scope3Calculator'
+)
+
+# Step 3: NewEmissionsHandler constructor — wire all three calculators
+CTOR_FIELD_RE = re.compile(r'^\t\tcalculator:    cfg\.Scope2Calculator,$', re.M)
+CTOR_FIELD_REPL = (
+    '\t\tscope1Calculator: cfg.Scope1Calculator,\n'
+    '\t\tscope2Calculator: cfg.Scope2Calculator,\n'
+    '\t\tscope3Calculator: cfg.Scope3Calculator,'
+)
+
+# Step 4a: listEmissions on a pristine file — expand the Scope 2-only batch
+# into all three scopes and combine the record slices ahead of response
+# conversion. The trailing convert-comment anchor is what distinguishes this
+# call site from the getSummary one, so this must run before step 5.
+LIST_CALC_RE = re.compile(
+    r'\trecords, err := h\.calculator\.CalculateBatch\(ctx, emissionsActivities\)\n'
+    r'(?P<errcheck>\tif err != nil \{\n(?:\t+[^\n]*\n)+?\t\}\n)'
+    r'\n?\tvar scope2Total float64\n'
+    r'\tfor _, rec := range records \{\n'
+    r'\t\tscope2Total \+= rec\.EmissionsTonnesCO2e\n'
+    r'\t\}\n'
+    r'\n*(?P<convert>\t// Convert to response format\n)'
+)
+LIST_CALC_REPL = (
+    '\t// Calculate emissions for all scopes\n'
+    '\tscope1Records, _ := h.scope1Calculator.CalculateBatch(ctx, emissionsActivities)\n'
+    '\tscope2Records, err := h.scope2Calculator.CalculateBatch(ctx, emissionsActivities)\n'
+    '\\g<errcheck>'
+    '\tscope3Records, _ := h.scope3Calculator.CalculateBatch(ctx, emissionsActivities)\n'
+    '\n'
+    '\t// Combine all scope records\n'
+    '\tallRecords := make([]emissions.EmissionRecord, 0, len(scope1Records)+len(scope2Records)+len(scope3Records))\n'
+    '\tallRecords = append(allRecords, scope1Records...)\n'
+    '\tallRecords = append(allRecords, scope2Records...)\n'
+    '\tallRecords = append(allRecords, scope3Records...)\n'
+    '\n'
+    '\\g<convert>'
+)
+
+# Step 4b: listEmissions mid-pipeline (per-scope totals already expanded) —
+# drop the totals, which listing does not need, and combine the slices
+LIST_AGG_RE = re.compile(
+    r'\tvar scope1Total, scope2Total, scope3Total float64\n'
+    r'(?:\tfor _, rec := range scope[123]Records \{\n'
+    r'\t\tscope[123]Total \+= rec\.EmissionsTonnesCO2e\n'
+    r'\t\}\n)+'
+    r'\n*(?P<convert>\t// Convert to response format\n)'
+)
+LIST_AGG_REPL = (
+    '\n'
+    '\t// Combine all scope records\n'
+    '\tallRecords := make([]emissions.EmissionRecord, 0, len(scope1Records)+len(scope2Records)+len(scope3Records))\n'
+    '\tallRecords = append(allRecords, scope1Records...)\n'
+    '\tallRecords = append(allRecords, scope2Records...)\n'
+    '\tallRecords = append(allRecords, scope3Records...)\n'
+    '\n'
+    '\\g<convert>'
+)
+
+# Step 5: getSummary — expand the Scope 2-only batch into all three scopes,
+# preserving the existing error handling via the named group. The errcheck
+# body is line-bounded (indented lines up to the closing brace) and the
+# scope2Total block must follow immediately, so the match cannot stretch
+# across function boundaries when the same call site appears twice.
+SUMMARY_CALC_RE = re.compile(
+    r'\trecords, err := h\.calculator\.CalculateBatch\(ctx, emissionsActivities\)\n'
+    r'(?P<errcheck>\tif err != nil \{\n(?:\t+[^\n]*\n)+?\t\}\n)'
+    r'\n?\tvar scope2Total float64\n'
+    r'\tfor _, rec := range records \{\n'
+    r'\t\tscope2Total \+= rec\.EmissionsTonnesCO2e\n'
+    r'\t\}\n'
+)
+SUMMARY_CALC_REPL = (
+    '\t// Calculate all scopes\n'
+    '\tscope1Records, _ := h.scope1Calculator.CalculateBatch(ctx, emissionsActivities)\n'
+    '\tscope2Records, err := h.scope2Calculator.CalculateBatch(ctx, emissionsActivities)\n'
+    '\\g<errcheck>'
+    '\tscope3Records, _ := h.scope3Calculator.CalculateBatch(ctx, emissionsActivities)\n'
+    '\n'
+    '\tvar scope1Total, scope2Total, scope3Total float64\n'
+    '\tfor _, rec := range scope1Records {\n'
+    '\t\tscope1Total += rec.EmissionsTonnesCO2e\n'
+    '\t}\n'
+    '\tfor _, rec := range scope2Records {\n'
+    '\t\tscope2Total += rec.EmissionsTonnesCO2e\n'
+    '\t}\n'
+    '\tfor _, rec := range scope3Records {\n'
+    '\t\tscope3Total += rec.EmissionsTonnesCO2e\n'
+    '\t}\n'
+    '\n'
+    '\tallRecords := len(scope1Records) + len(scope2Records) + len(scope3Records)\n'
+)
+
+# Step 6: rename the listEmissions 'records' references and fix the summary
+# fields; each is an exact-line match applied in one pass
+LINE_EDITS = (
+    (re.compile(r'^\tresponse := make\(\[\]EmissionRecord, 0, len\(records\)\)$', re.M),
+     '\tresponse := make([]EmissionRecord, 0, len(allRecords))'),
+    (re.compile(r'^\tfor i, rec := range records \{$', re.M),
+     '\tfor i, rec := range allRecords {'),
+    (re.compile(r'^\tpageInfo := responders\.NewPageInfo\(filter\.Page, filter\.PerPage, len\(records\)\)$', re.M),
+     '\tpageInfo := responders.NewPageInfo(filter.Page, filter.PerPage, len(allRecords))'),
+    (re.compile(r'Scope1TonsCO2e: 0, // TODO[^\n]*'), 'Scope1TonsCO2e: scope1Total,'),
+    (re.compile(r'Scope3TonsCO2e: 0, // TODO[^\n]*'), 'Scope3TonsCO2e: scope3Total,'),
+    (re.compile(r'TotalTonsCO2e:  scope2Total,'), 'TotalTonsCO2e:  scope1Total + scope2Total + scope3Total,'),
+    (re.compile(r'ActivityCount:  len\(records\),'), 'ActivityCount:  allRecords,'),
+)
+
+def update_struct(content: str) -> str:
+    return STRUCT_FIELD_RE.sub(STRUCT_FIELD_REPL, content)
+
+def update_config(content: str) -> str:
+    return CONFIG_FIELD_RE.sub(CONFIG_FIELD_REPL, content)
+
+def update_constructor(content: str) -> str:
+    return CTOR_FIELD_RE.sub(CTOR_FIELD_REPL, content)
+
+def update_list_calc_expand(content: str) -> str:
+    return LIST_CALC_RE.sub(LIST_CALC_REPL, content)
+
+def update_list_calcs(content: str) -> str:
+    return LIST_AGG_RE.sub(LIST_AGG_REPL, content)
+
+def update_summary_calcs(content: str) -> str:
+    return SUMMARY_CALC_RE.sub(SUMMARY_CALC_REPL, content)
+
+def update_lines(content: str) -> str:
+    for pattern, repl in LINE_EDITS:
+        content = pattern.sub(repl, content)
+    return content
+
+# Step 4a must precede step 5: on a pristine file both functions contain the
+# identical calc block, and only the convert-comment anchor tells the
+# listEmissions occurrence apart from the getSummary one
+TRANSFORMS = (
+    update_struct,
+    update_config,
+    update_constructor,
+    update_list_calc_expand,
+    update_list_calcs,
+    update_summary_calcs,
+    update_lines,
+)
+
+def main():
+    current = content_hash(TARGET.read_bytes())
+    if STAMP.exists() and STAMP.read_text() == current:
+        print("✅ emissions_handler.go unchanged since last run; skipping")
+        return
+
+    content = TARGET.read_text(encoding='utf-8')
+    for transform in TRANSFORMS:
+        content = transform(content)
+
+    # Fail loudly before writing if the rewrite left stale references
+    # behind — a half-matched input shape must not be reported as fixed
+    for leftover in ('h.calculator.CalculateBatch', 'len(records)'):
+        assert leftover not in content, (
+            f'partial rewrite: {leftover!r} still present; '
+            'emissions_handler.go is not in a supported input shape'
+        )
+
+    TARGET.write_text(content, encoding='utf-8')
+    STAMP.write_text(content_hash(content.encode('utf-8')))
+
+    print("✅ Complete fix applied to emissions_handler.go")
+    print("   - Updated all calculator references")
+    print("   - Combined scope records correctly")
+    print("   - Fixed all 'records' variable references")
+
+if __name__ == '__main__':
+    main()
@@ -1,209 +1,336 @@
 #!/usr/bin/env python3
 """
 Script to integrate Scope 1 and Scope 3 calculators - ROBUST VERSION
+
+Each handler rewrite is an explicit finite-state machine driven in a single
+pass: every line is dispatched once through a per-state handler that returns
+the next state and the lines to emit. There is no lookahead or lookbehind
+indexing, so no off-by-one risk at file boundaries. Lines are pre-tagged
+with the keywords they contain (O(1) set membership in the handlers), output
+accumulates in one io.StringIO buffer, and a blake2b stamp short-circuits
+repeat runs.
 """
 
-import re
+import hashlib
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+
+COMPLIANCE_TARGET = 'internal/api/http/handlers/compliance_handler.go'
+EMISSIONS_TARGET = 'internal/api/http/handlers/emissions_handler.go'
+
+# Every substring the compliance_handler state machine branches on
+COMPLIANCE_KEYWORDS = (
+    'type ComplianceHandlerDeps struct {',
+    'scope2Records, err := deps.Scope2Calculator.CalculateBatch',
+    'scope2Records, _ := deps.Scope2Calculator.CalculateBatch',
+    'TotalScope1Tons: 0, // TODO',
+    'TotalScope3Tons: 0, // TODO',
+    '"scope1Ready": false, // TODO',
+    '"scope3Ready": false, // TODO',
+    'Scope2Calculator',
+    'var scope2TotalTons',
+    'var scope2Total float64',
+    'for _, rec := range scope2Records',
+    'EmissionsTonnesCO2e',
+    '}',
+)
+
+# Every substring the emissions_handler state machine branches on
+EMISSIONS_KEYWORDS = (
+    'scope2Records, _ := h.deps.Scope2Calculator.CalculateBatch',
+    'Scope1TonsCO2e: 0, // TODO',
+    'Scope3TonsCO2e: 0, // TODO',
+    'var scope2Total float64',
+    'EmissionsTonnesCO2e',
+)
+
+# Emitted blocks for the compliance CSRD handler rewrite
+CSRD_CALC_OPEN = (
+    '\t\t// Calculate Scope 1 (direct emissions)\n',
+    '\t\tscope1Records, err := deps.Scope1Calculator.CalculateBatch(ctx, emissionsActivities)\n',
+    '\t\tif err != nil {\n',
+    '\t\t\tresponders.Error(w, http.StatusInternalServerError, "scope1_calc_failed", "failed to calculate scope 1 emissions")\n',
+    '\t\t\treturn\n',
+    '\t\t}\n',
+    '\n',
+    '\t\t// Calculate Scope 2 (purchased electricity)\n',
+    '\t\tscope2Records, err := deps.Scope2Calculator.CalculateBatch(ctx, emissionsActivities)\n',
+)
+
+CSRD_SCOPE3_AND_AGG = (
+    '\n',
+    '\t\t// Calculate Scope 3 (value chain)\n',
+    '\t\tscope3Records, err := deps.Scope3Calculator.CalculateBatch(ctx, emissionsActivities)\n',
+    '\t\tif err != nil {\n',
+    '\t\t\tresponders.Error(w, http.StatusInternalServerError, "scope3_calc_failed", "failed to calculate scope 3 emissions")\n',
+    '\t\t\treturn\n',
+    '\t\t}\n',
+    '\n',
+    '\t\t// Aggregate emissions by scope\n',
+    '\t\tvar scope1TotalTons, scope2TotalTons, scope3TotalTons float64\n',
+    '\t\tfor _, rec := range scope1Records {\n',
+    '\t\t\tscope1TotalTons += rec.EmissionsTonnesCO2e\n',
+    '\t\t}\n',
+)
+
+CSRD_SCOPE3_LOOP = (
+    '\t\tfor _, rec := range scope3Records {\n',
+    '\t\t\tscope3TotalTons += rec.EmissionsTonnesCO2e\n',
+    '\t\t}\n',
+)
+
+# Emitted blocks for the compliance summary handler rewrite
+SUMMARY_CALC_OPEN = (
+    '\t\t// Calculate all scopes\n',
+    '\t\tscope1Records, _ := deps.Scope1Calculator.CalculateBatch(ctx, emissionsActivities)\n',
+    '\t\tscope2Records, _ := deps.Scope2Calculator.CalculateBatch(ctx, emissionsActivities)\n',
+    '\t\tscope3Records, _ := deps.Scope3Calculator.CalculateBatch(ctx, emissionsActivities)\n',
+    '\n',
+    '\t\tvar scope1Total, scope2Total, scope3Total float64\n',
+    '\t\tfor _, rec := range scope1Records {\n',
+    '\t\t\tscope1Total += rec.EmissionsTonnesCO2e\n',
+    '\t\t}\n',
+)
+
+SUMMARY_SCOPE3_LOOP = (
+    '\t\tfor _, rec := range scope3Records {\n',
+    '\t\t\tscope3Total += rec.EmissionsTonnesCO2e\n',
+    '\t\t}\n',
+)
+
+# Emitted blocks for the emissions handler rewrite
+EMISSIONS_CALC_OPEN = (
+    '\t// Calculate all scopes\n',
+    '\tscope1Records, _ := h.deps.Scope1Calculator.CalculateBatch(ctx, emissionsActivities)\n',
+    '\tscope2Records, _ := h.deps.Scope2Calculator.CalculateBatch(ctx, emissionsActivities)\n',
+    '\tscope3Records, _ := h.deps.Scope3Calculator.CalculateBatch(ctx, emissionsActivities)\n',
+    '\n',
+)
+
+EMISSIONS_VAR3 = '\tvar scope1Total, scope2Total, scope3Total float64\n'
+
+EMISSIONS_SCOPE1_LOOP = (
+    '\tfor _, rec := range scope1Records {\n',
+    '\t\tscope1Total += rec.EmissionsTonnesCO2e\n',
+    '\t}\n',
+)
+
+EMISSIONS_SCOPE3_LOOP = (
+    '\tfor _, rec := range scope3Records {\n',
+    '\t\tscope3Total += rec.EmissionsTonnesCO2e\n',
+    '\t}\n',
+)
+
+def tag_lines(lines, keywords):
+    """One pass over the file building a keyword frozenset per line."""
+    return [frozenset(k for k in keywords if k in line) for line in lines]
+
+def _content_hash(data):
+    """blake2b digest of file content (faster than sha256 on large files)."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def already_applied(target, stamp):
+    """True when the stamp records the target's current content hash."""
+    if not os.path.exists(stamp):
+        return False
+    with open(target, 'rb') as f:
+        current = _content_hash(f.read())
+    with open(stamp, 'r', encoding='utf-8') as f:
+        return f.read() == current
+
+def write_stamp(target, stamp):
+    """Record the target's post-rewrite hash so repeat runs short-circuit."""
+    with open(target, 'rb') as f:
+        digest = _content_hash(f.read())
+    with open(stamp, 'w', encoding='utf-8') as f:
+        f.write(digest)
+
+def run_fsm(lines, keywords, handlers, start_state):
+    """
+    Drive a line-oriented FSM over the file in a single pass.
+
+    Each handler receives (line, tags, ctx) and returns (next_state, emit)
+    where emit is an iterable of output lines. ctx is a small scratch dict
+    for the rare case where a decision depends on the following line (the
+    deferred line is stashed instead of indexing backwards or forwards).
+    """
+    tags = tag_lines(lines, keywords)
+    buf = io.StringIO()
+    state = start_state
+    ctx = {}
+    for line, line_tags in zip(lines, tags):
+        state, emit = handlers[state](line, line_tags, ctx)
+        for out in emit:
+            buf.write(out)
+    return buf.getvalue()
+
+# --- compliance_handler.go state machine ---
+
+ComplianceState = IntEnum(
+    'ComplianceState',
+    'SCAN IN_DEPS CSRD_ERRCHECK CSRD_SEEK_LOOP CSRD_IN_LOOP CSRD_CLOSE SUMMARY_PENDING SUMMARY_COPY SUMMARY_CLOSE'
+)
+
+def _c_scan(line, tags, ctx):
+    if 'type ComplianceHandlerDeps struct {' in tags:
+        return ComplianceState.IN_DEPS, (line,)
+    if 'scope2Records, err := deps.Scope2Calculator.CalculateBatch' in tags:
+        return ComplianceState.CSRD_ERRCHECK, CSRD_CALC_OPEN
+    if 'scope2Records, _ := deps.Scope2Calculator.CalculateBatch' in tags:
+        # Only a summary block if the next line declares scope2Total; defer
+        # the decision by stashing this line instead of looking ahead
+        ctx['deferred'] = line
+        return ComplianceState.SUMMARY_PENDING, ()
+    if 'TotalScope1Tons: 0, // TODO' in tags:
+        return ComplianceState.SCAN, (line.replace('0, // TODO: Implement Scope 1 calculator (direct emissions)', 'scope1TotalTons,'),)
+    if 'TotalScope3Tons: 0, // TODO' in tags:
+        return ComplianceState.SCAN, (line.replace('0, // TODO: Implement Scope 3 calculator (value chain)', 'scope3TotalTons,'),)
+    if '"scope1Ready": false, // TODO' in tags:
+        return ComplianceState.SCAN, (line.replace('"scope1Ready": false, // TODO', '"scope1Ready": scope1Total > 0,'),)
+    if '"scope3Ready": false, // TODO' in tags:
+        return ComplianceState.SCAN, (line.replace('"scope3Ready": false, // TODO', '"scope3Ready": scope3Total > 0,'),)
+    return ComplianceState.SCAN, (line,)
+
+def _c_in_deps(line, tags, ctx):
+    if 'Scope2Calculator' in tags:
+        # Wrap the existing Scope2 field with Scope1 before and Scope3 after
+        return ComplianceState.IN_DEPS, (
+            '\tScope1Calculator *emissions.Scope1Calculator\n',
+            line,
+            '\tScope3Calculator *emissions.Scope3Calculator\n',
+        )
+    if '}' in tags:
+        return ComplianceState.SCAN, (line,)
+    return ComplianceState.IN_DEPS, (line,)
+
+def _c_csrd_errcheck(line, tags, ctx):
+    # Copy the scope2 error handling; the old var declaration is replaced by
+    # the scope3 calculation plus three-scope aggregation
+    if 'var scope2TotalTons' in tags:
+        return ComplianceState.CSRD_SEEK_LOOP, CSRD_SCOPE3_AND_AGG
+    return ComplianceState.CSRD_ERRCHECK, (line,)
+
+def _c_csrd_seek_loop(line, tags, ctx):
+    if 'for _, rec := range scope2Records' in tags:
+        return ComplianceState.CSRD_IN_LOOP, (line,)
+    return ComplianceState.CSRD_SEEK_LOOP, ()
+
+def _c_csrd_in_loop(line, tags, ctx):
+    if 'EmissionsTonnesCO2e' in tags:
+        return ComplianceState.CSRD_CLOSE, (line,)
+    return ComplianceState.CSRD_IN_LOOP, (line,)
+
+def _c_csrd_close(line, tags, ctx):
+    # line is the loop's closing brace; append the scope3 loop after it
+    return ComplianceState.SCAN, (line,) + CSRD_SCOPE3_LOOP
+
+def _c_summary_pending(line, tags, ctx):
+    if 'var scope2Total float64' in tags:
+        # Confirmed summary block: drop the deferred line and the old var
+        ctx.pop('deferred', None)
+        return ComplianceState.SUMMARY_COPY, SUMMARY_CALC_OPEN
+    # Not the summary block after all — emit the deferred line unchanged and
+    # process the current line as a normal scan line
+    deferred = ctx.pop('deferred', None)
+    state, emit = _c_scan(line, tags, ctx)
+    return state, ((deferred,) if deferred else ()) + tuple(emit)
+
+def _c_summary_copy(line, tags, ctx):
+    if 'EmissionsTonnesCO2e' in tags:
+        return ComplianceState.SUMMARY_CLOSE, (line,)
+    return ComplianceState.SUMMARY_COPY, (line,)
+
+def _c_summary_close(line, tags, ctx):
+    return ComplianceState.SCAN, (line,) + SUMMARY_SCOPE3_LOOP
+
+COMPLIANCE_HANDLERS = {
+    ComplianceState.SCAN: _c_scan,
+    ComplianceState.IN_DEPS: _c_in_deps,
+    ComplianceState.CSRD_ERRCHECK: _c_csrd_errcheck,
+    ComplianceState.CSRD_SEEK_LOOP: _c_csrd_seek_loop,
+    ComplianceState.CSRD_IN_LOOP: _c_csrd_in_loop,
+    ComplianceState.CSRD_CLOSE: _c_csrd_close,
+    ComplianceState.SUMMARY_PENDING: _c_summary_pending,
+    ComplianceState.SUMMARY_COPY: _c_summary_copy,
+    ComplianceState.SUMMARY_CLOSE: _c_summary_close,
+}
+
+# --- emissions_handler.go state machine ---
+
+EmissionsState = IntEnum('EmissionsState', 'SCAN VAR COPY_LOOP CLOSE')
+
+def _e_scan(line, tags, ctx):
+    if 'scope2Records, _ := h.deps.Scope2Calculator.CalculateBatch' in tags:
+        return EmissionsState.VAR, EMISSIONS_CALC_OPEN
+    if 'Scope1TonsCO2e: 0, // TODO' in tags:
+        return EmissionsState.SCAN, (line.replace('0, // TODO: Implement Scope 1', 'scope1Total,'),)
+    if 'Scope3TonsCO2e: 0, // TODO' in tags:
+        return EmissionsState.SCAN, (line.replace('0, // TODO: Implement Scope 3', 'scope3Total,'),)
+    return EmissionsState.SCAN, (line,)
+
+def _e_var(line, tags, ctx):
+    if 'var scope2Total float64' in tags:
+        # Replace the old declaration and lead in with the scope1 loop
+        return EmissionsState.COPY_LOOP, (EMISSIONS_VAR3,) + EMISSIONS_SCOPE1_LOOP
+    # No var line; still emit the scope1 loop, then copy this line through
+    next_state = EmissionsState.CLOSE if 'EmissionsTonnesCO2e' in tags else EmissionsState.COPY_LOOP
+    return next_state, EMISSIONS_SCOPE1_LOOP + (line,)
+
+def _e_copy_loop(line, tags, ctx):
+    if 'EmissionsTonnesCO2e' in tags:
+        return EmissionsState.CLOSE, (line,)
+    return EmissionsState.COPY_LOOP, (line,)
+
+def _e_close(line, tags, ctx):
+    return EmissionsState.SCAN, (line,) + EMISSIONS_SCOPE3_LOOP
+
+EMISSIONS_HANDLERS = {
+    EmissionsState.SCAN: _e_scan,
+    EmissionsState.VAR: _e_var,
+    EmissionsState.COPY_LOOP: _e_copy_loop,
+    EmissionsState.CLOSE: _e_close,
+}
 
 def update_compliance_handler():
-    with open('internal/api/http/handlers/compliance_handler.go', 'r', encoding='utf-8') as f:
+    stamp = '.fix_compliance_handler.stamp'
+    if already_applied(COMPLIANCE_TARGET, stamp):
+        print("✅ compliance_handler.go unchanged since last run; skipping")
+        return
+
+    with open(COMPLIANCE_TARGET, 'r', encoding='utf-8') as f:
         lines = f.readlines()
-    
-    output = []
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        
-        # Step 1: Update ComplianceHandlerDeps struct
-        if 'type ComplianceHandlerDeps struct {' in line:
-            output.append(line)
-            i += 1
-            # Add all fields
-            found_scope2 = False
-            while i < len(lines) and '}' not in lines[i]:
-                if 'Scope2Calculator' in lines[i]:
-                    # Add Scope1 before Scope2
-                    output.append('\tScope1Calculator *emissions.Scope1Calculator\n')
-                    output.append(lines[i])
-                    # Add Scope3 after Scope2
-                    i += 1
-                    output.append('\tScope3Calculator *emissions.Scope3Calculator\n')
-                    found_scope2 = True
-                    continue
-                output.append(lines[i])
-                i += 1
-            output.append(lines[i])  # closing brace
-            i += 1
-            continue
-        
-        # Step 2: Replace Scope 2-only calculation with all three scopes
-        if 'scope2Records, err := deps.Scope2Calculator.CalculateBatch' in line:
-            # Replace the whole scope2 calculation block with all three scopes
-            output.append('\t\t// Calculate Scope 1 (direct emissions)\n')
-            output.append('\t\tscope1Records, err := deps.Scope1Calculator.CalculateBatch(ctx, emissionsActivities)\n')
-            output.append('\t\tif err != nil {\n')
-            output.append('\t\t\tresponders.Error(w, http.StatusInternalServerError, "scope1_calc_failed", "failed to calculate scope 1 emissions")\n')
-            output.append('\t\t\treturn\n')
-            output.append('\t\t}\n')
-            output.append('\n')
-            output.append('\t\t// Calculate Scope 2 (purchased electricity)\n')
-            output.append('\t\tscope2Records, err := deps.Scope2Calculator.CalculateBatch(ctx, emissionsActivities)\n')
-            # Skip the original scope2 line
-            i += 1
-            # Copy error handling
-            while i < len(lines) and 'var scope2TotalTons' not in lines[i]:
-                output.append(lines[i])
-                i += 1
-            
-            # Add Scope 3 calculation
-            output.append('\n')
-            output.append('\t\t// Calculate Scope 3 (value chain)\n')
-            output.append('\t\tscope3Records, err := deps.Scope3Calculator.CalculateBatch(ctx, emissionsActivities)\n')
-            output.append('\t\tif err != nil {\n')
-            output.append('\t\t\tresponders.Error(w, http.StatusInternalServerError, "scope3_calc_failed", "failed to calculate scope 3 emissions")\n')
-            output.append('\t\t\treturn\n')
-            output.append('\t\t}\n')
-            output.append('\n')
-            
-            # Add aggregation for all three scopes
-            output.append('\t\t// Aggregate emissions by scope\n')
-            output.append('\t\tvar scope1TotalTons, scope2TotalTons, scope3TotalTons float64\n')
-            # Skip old var line
-            i += 1
-            # Add aggregation loops
-            output.append('\t\tfor _, rec := range scope1Records {\n')
-            output.append('\t\t\tscope1TotalTons += rec.EmissionsTonnesCO2e\n')
-            output.append('\t\t}\n')
-            # Copy the existing scope2 loop
-            while i < len(lines) and 'for _, rec := range scope2Records' not in lines[i]:
-                i += 1
-            while i < len(lines):
-                output.append(lines[i])
-                i += 1
-                if '}' in lines[i-1] and 'EmissionsTonnesCO2e' in lines[i-2]:
-                    break
-            # Add scope3 loop
-            output.append('\t\tfor _, rec := range scope3Records {\n')
-            output.append('\t\t\tscope3TotalTons += rec.EmissionsTonnesCO2e\n')
-            output.append('\t\t}\n')
-            continue
-        
-        # Step 3: Remove TODOs in report struct
-        if 'TotalScope1Tons: 0, // TODO' in line:
-            output.append(line.replace('0, // TODO: Implement Scope 1 calculator (direct emissions)', 'scope1TotalTons,'))
-            i += 1
-            continue
-        
-        if 'TotalScope3Tons: 0, // TODO' in line:
-            output.append(line.replace('0, // TODO: Implement Scope 3 calculator (value chain)', 'scope3TotalTons,'))
-            i += 1
-            continue
-        
-        # Step 4: Update compliance summary calculations
-        if '"scope1Ready": false, // TODO' in line:
-            output.append(line.replace('"scope1Ready": false, // TODO', '"scope1Ready": scope1Total > 0,'))
-            i += 1
-            continue
-        
-        if '"scope3Ready": false, // TODO' in line:
-            output.append(line.replace('"scope3Ready": false, // TODO', '"scope3Ready": scope3Total > 0,'))
-            i += 1
-            continue
-        
-        # For the summary handler, expand scope2 to all scopes
-        if i < len(lines) - 5 and 'scope2Records, _ := deps.Scope2Calculator.CalculateBatch' in line and 'var scope2Total float64' in lines[i+1]:
-            # This is in the summary handler - replace with all three scopes
-            output.append('\t\t// Calculate all scopes\n')
-            output.append('\t\tscope1Records, _ := deps.Scope1Calculator.CalculateBatch(ctx, emissionsActivities)\n')
-            output.append('\t\tscope2Records, _ := deps.Scope2Calculator.CalculateBatch(ctx, emissionsActivities)\n')
-            output.append('\t\tscope3Records, _ := deps.Scope3Calculator.CalculateBatch(ctx, emissionsActivities)\n')
-            output.append('\n')
-            output.append('\t\tvar scope1Total, scope2Total, scope3Total float64\n')
-            # Skip original lines
-            i += 2
-            # Add all three loops
-            output.append('\t\tfor _, rec := range scope1Records {\n')
-            output.append('\t\t\tscope1Total += rec.EmissionsTonnesCO2e\n')
-            output.append('\t\t}\n')
-            # Copy scope2 loop
-            while i < len(lines):
-                output.append(lines[i])
-                i += 1
-                if '}' in lines[i-1] and 'scope2Total' in lines[i-2]:
-                    break
-            output.append('\t\tfor _, rec := range scope3Records {\n')
-            output.append('\t\t\tscope3Total += rec.EmissionsTonnesCO2e\n')
-            output.append('\t\t}\n')
-            continue
-        
-        # Default: copy line as-is
-        output.append(line)
-        i += 1
-    
-    with open('internal/api/http/handlers/compliance_handler.go', 'w', encoding='utf-8') as f:
-        f.writelines(output)
-    
+
+    result = run_fsm(lines, COMPLIANCE_KEYWORDS, COMPLIANCE_HANDLERS, ComplianceState.SCAN)
+
+    with open(COMPLIANCE_TARGET, 'w', encoding='utf-8') as f:
+        f.write(result)
+    write_stamp(COMPLIANCE_TARGET, stamp)
+
     print("✅ Updated compliance_handler.go")
 
 def update_emissions_handler():
-    with open('internal/api/http/handlers/emissions_handler.go', 'r', encoding='utf-8') as f:
+    stamp = '.fix_emissions_handler.stamp'
+    if already_applied(EMISSIONS_TARGET, stamp):
+        print("✅ emissions_handler.go unchanged since last run; skipping")
+        return
+
+    with open(EMISSIONS_TARGET, 'r', encoding='utf-8') as f:
         lines = f.readlines()
-    
-    output = []
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        
-        # Replace scope2-only calculation with all three scopes
-        if 'scope2Records, _ := h.deps.Scope2Calculator.CalculateBatch' in line:
-            output.append('\t// Calculate all scopes\n')
-            output.append('\tscope1Records, _ := h.deps.Scope1Calculator.CalculateBatch(ctx, emissionsActivities)\n')
-            output.append('\tscope2Records, _ := h.deps.Scope2Calculator.CalculateBatch(ctx, emissionsActivities)\n')
-            output.append('\tscope3Records, _ := h.deps.Scope3Calculator.CalculateBatch(ctx, emissionsActivities)\n')
-            output.append('\n')
-            # Skip original line
-            i += 1
-            # Replace var declaration
-            if 'var scope2Total float64' in lines[i]:
-                output.append('\tvar scope1Total, scope2Total, scope3Total float64\n')
-                i += 1
-            # Add scope1 loop
-            output.append('\tfor _, rec := range scope1Records {\n')
-            output.append('\t\tscope1Total += rec.EmissionsTonnesCO2e\n')
-            output.append('\t}\n')
-            # Copy scope2 loop
-            while i < len(lines):
-                output.append(lines[i])
-                i += 1
-                if '}' in lines[i-1] and 'scope2Total' in lines[i-2]:
-                    break
-            # Add scope3 loop
-            output.append('\tfor _, rec := range scope3Records {\n')
-            output.append('\t\tscope3Total += rec.EmissionsTonnesCO2e\n')
-            output.append('\t}\n')
-            continue
-        
-        # Remove TODOs in EmissionsSummary
-        if 'Scope1TonsCO2e: 0, // TODO' in line:
-            output.append(line.replace('0, // TODO: Implement Scope 1', 'scope1Total,'))
-            i += 1
-            continue
-        
-        if 'Scope3TonsCO2e: 0, // TODO' in line:
-            output.append(line.replace('0, // TODO: Implement Scope 3', 'scope3Total,'))
-            i += 1
-            continue
-        
-        # Default: copy line as-is
-        output.append(line)
-        i += 1
-    
-    with open('internal/api/http/handlers/emissions_handler.go', 'w', encoding='utf-8') as f:
-        f.writelines(output)
-    
+
+    result = run_fsm(lines, EMISSIONS_KEYWORDS, EMISSIONS_HANDLERS, EmissionsState.SCAN)
+
+    with open(EMISSIONS_TARGET, 'w', encoding='utf-8') as f:
+        f.write(result)
+    write_stamp(EMISSIONS_TARGET, stamp)
+
     print("✅ Updated emissions_handler.go")
 
 if __name__ == '__main__':
-    update_compliance_handler()
-    update_emissions_handler()
+    # The two handlers rewrite disjoint files, so run them in parallel;
+    # threads are enough for this I/O-dominated workload
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for _ in executor.map(lambda fn: fn(), (update_compliance_handler, update_emissions_handler)):
+            pass
     print("\n🎉 All handlers updated successfully!")
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Integrate Scope 1 and Scope 3 calculators into the HTTP handlers.
+
+Merges integrate_scope1_scope3_compliance.py and
+integrate_scope1_scope3_emissions.py, which shared most of their logic and
+each paid interpreter startup and pattern compilation separately. One
+process now drives both handler files from a shared edit-recipe list.
+"""
+
+import functools
+import mmap
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Final
+
+@functools.cache
+def repo_root() -> Path:
+    """
+    Locate the repo root by walking up from this file to go.mod.
+
+    Memoized so the stat chain is paid once per process; handler paths are
+    resolved against it, making the script cwd-independent.
+    """
+    here = Path(__file__).resolve()
+    for parent in here.parents:
+        if (parent / 'go.mod').exists():
+            return parent
+    raise RuntimeError(f'go.mod not found above {here}')
+
+@functools.cache
+def _deps_re():
+    """
+    Compile the deps-struct pattern on first use and memoize it.
+
+    Unlike a bare module-level compile, the cached getter survives being
+    looped over multiple handler files: the compile is paid once per
+    process and cannot be evicted from re's internal cache.
+    """
+    return re.compile(r'(type ComplianceHandlerDeps struct \{\s+)Scope2Calculator \*emissions\.Scope2Calculator(\s+\})')
+
+DEPS_REPLACEMENT: Final[str] = r'\1Scope1Calculator *emissions.Scope1Calculator\n\tScope2Calculator *emissions.Scope2Calculator\n\tScope3Calculator *emissions.Scope3Calculator\2'
+
+# compliance CSRD handler: replace the Scope 2-only calculation with all
+# three scopes
+CSRD_CALC_INSERTION: Final[str] = '''		// Calculate Scope 1 (direct emissions)
+		scope1Records, err := deps.Scope1Calculator.CalculateBatch(ctx, emissionsActivities)
+		if err != nil {
+			responders.Error(w, http.StatusInternalServerError, "scope1_calc_failed", "failed to calculate scope 1 emissions")
+			return
+		}
+
+		// Calculate Scope 2 (purchased electricity)
+		scope2Records, err := deps.Scope2Calculator.CalculateBatch(ctx, emissionsActivities)
+		if err != nil {
+			responders.Error(w, http.StatusInternalServerError, "scope2_calc_failed", "failed to calculate scope 2 emissions")
+			return
+		}
+
+		// Calculate Scope 3 (value chain)
+		scope3Records, err := deps.Scope3Calculator.CalculateBatch(ctx, emissionsActivities)
+		if err != nil {
+			responders.Error(w, http.StatusInternalServerError, "scope3_calc_failed", "failed to calculate scope 3 emissions")
+			return
+		}
+
+		// Aggregate emissions by scope
+		var scope1TotalTons, scope2TotalTons, scope3TotalTons float64
+		for _, rec := range scope1Records {
+			scope1TotalTons += rec.EmissionsTonnesCO2e
+		}
+		for _, rec := range scope2Records {
+			scope2TotalTons += rec.EmissionsTonnesCO2e
+		}
+		for _, rec := range scope3Records {
+			scope3TotalTons += rec.EmissionsTonnesCO2e
+		}'''
+
+CSRD_OLD_CALC: Final[str] = '''		scope2Records, err := deps.Scope2Calculator.CalculateBatch(ctx, emissionsActivities)
+		if err != nil {
+			responders.Error(w, http.StatusInternalServerError, "scope2_calc_failed", "failed to calculate scope 2 emissions")
+			return
+		}
+
+		var scope2TotalTons float64
+		for _, rec := range scope2Records {
+			scope2TotalTons += rec.EmissionsTonnesCO2e
+		}'''
+
+# compliance summary handler: expand the Scope 2-only calculation
+SUMMARY_CALC: Final[str] = '''		// Calculate all scopes
+		scope1Records, _ := deps.Scope1Calculator.CalculateBatch(ctx, emissionsActivities)
+		scope2Records, _ := deps.Scope2Calculator.CalculateBatch(ctx, emissionsActivities)
+		scope3Records, _ := deps.Scope3Calculator.CalculateBatch(ctx, emissionsActivities)
+
+		var scope1Total, scope2Total, scope3Total float64
+		for _, rec := range scope1Records {
+			scope1Total += rec.EmissionsTonnesCO2e
+		}
+		for _, rec := range scope2Records {
+			scope2Total += rec.EmissionsTonnesCO2e
+		}
+		for _, rec := range scope3Records {
+			scope3Total += rec.EmissionsTonnesCO2e
+		}'''
+
+SUMMARY_OLD_CALC: Final[str] = '''		scope2Records, _ := deps.Scope2Calculator.CalculateBatch(ctx, emissionsActivities)
+		var scope2Total float64
+		for _, rec := range scope2Records {
+			scope2Total += rec.EmissionsTonnesCO2e
+		}'''
+
+# emissions summary handler: same expansion against the h.deps receiver
+EMISSIONS_ALL_SCOPES_CALC: Final[str] = '''	// Calculate all scopes
+	scope1Records, _ := h.deps.Scope1Calculator.CalculateBatch(ctx, emissionsActivities)
+	scope2Records, _ := h.deps.Scope2Calculator.CalculateBatch(ctx, emissionsActivities)
+	scope3Records, _ := h.deps.Scope3Calculator.CalculateBatch(ctx, emissionsActivities)
+
+	var scope1Total, scope2Total, scope3Total float64
+	for _, rec := range scope1Records {
+		scope1Total += rec.EmissionsTonnesCO2e
+	}
+	for _, rec := range scope2Records {
+		scope2Total += rec.EmissionsTonnesCO2e
+	}
+	for _, rec := range scope3Records {
+		scope3Total += rec.EmissionsTonnesCO2e
+	}'''
+
+EMISSIONS_OLD_CALC: Final[str] = '''	scope2Records, _ := h.deps.Scope2Calculator.CalculateBatch(ctx, emissionsActivities)
+	var scope2Total float64
+	for _, rec := range scope2Records {
+		scope2Total += rec.EmissionsTonnesCO2e
+	}'''
+
+# Line-level TODO swaps, applied through one compiled alternation regex
+# per handler: the engine scans the file once, and the named group of each
+# hit dispatches to its replacement.
+COMPLIANCE_LINE_EDITS = {
+    'TotalScope1Tons: 0, // TODO: Implement Scope 1 calculator (direct emissions)': 'TotalScope1Tons: scope1TotalTons,',
+    'TotalScope3Tons: 0, // TODO: Implement Scope 3 calculator (value chain)': 'TotalScope3Tons: scope3TotalTons,',
+    '"scope1Ready": false, // TODO': '"scope1Ready": scope1Total > 0,',
+    '"scope3Ready": false, // TODO': '"scope3Ready": scope3Total > 0,',
+}
+
+EMISSIONS_LINE_EDITS = {
+    'Scope1TonsCO2e: 0, // TODO: Implement Scope 1': 'Scope1TonsCO2e: scope1Total,',
+    'Scope3TonsCO2e: 0, // TODO: Implement Scope 3': 'Scope3TonsCO2e: scope3Total,',
+}
+
+def _compile_scanner(edits):
+    """
+    Build one alternation regex plus a named-group dispatch table.
+
+    A single NFA traversal finds every TODO line in one pass, replacing a
+    separate full-buffer scan per literal.
+    """
+    pattern = re.compile('|'.join(
+        f'(?P<e{i}>{re.escape(old)})' for i, old in enumerate(edits)
+    ))
+    dispatch = {f'e{i}': new for i, new in enumerate(edits.values())}
+    return pattern, dispatch
+
+COMPLIANCE_SCANNER = _compile_scanner(COMPLIANCE_LINE_EDITS)
+EMISSIONS_SCANNER = _compile_scanner(EMISSIONS_LINE_EDITS)
+
+# Span edit recipes: (kind, find, replace) where kind selects the locator.
+# 'regex' takes a zero-arg pattern getter and a template for Match.expand;
+# 'block' takes a unique exact string found via str.find.
+COMPLIANCE_EDITS = [
+    ('regex', _deps_re, DEPS_REPLACEMENT),
+    ('block', CSRD_OLD_CALC, CSRD_CALC_INSERTION),
+    ('block', SUMMARY_OLD_CALC, SUMMARY_CALC),
+]
+
+EMISSIONS_EDITS = [
+    ('block', EMISSIONS_OLD_CALC, EMISSIONS_ALL_SCOPES_CALC),
+]
+
+# Each entry carries a sentinel that only exists after integration, so
+# repeat runs (e.g. CI) bail out on one substring scan instead of paying
+# the full rewrite churn
+HANDLERS = [
+    ('internal/api/http/handlers/compliance_handler.go',
+     'Scope1Calculator *emissions.Scope1Calculator',
+     COMPLIANCE_SCANNER, COMPLIANCE_EDITS),
+    ('internal/api/http/handlers/emissions_handler.go',
+     'h.deps.Scope1Calculator.CalculateBatch',
+     EMISSIONS_SCANNER, EMISSIONS_EDITS),
+]
+
+def find_block(s, old, new):
+    """
+    Locate the single occurrence of old and return its (start, end, new) edit.
+
+    str.find halts at the first match, and the assertion makes drift in the
+    target Go file fail loudly instead of silently no-opping.
+    """
+    i = s.find(old)
+    assert i >= 0, f"missing anchor: {old[:40]!r}"
+    return (i, i + len(old), new)
+
+def collect_edits(content, edits):
+    """Gather every (start, end, replacement) edit against original offsets."""
+    spans = []
+    for kind, find, replace in edits:
+        if kind == 'regex':
+            # search() halts at the first hit (the struct appears exactly
+            # once), so the tail of the file is never scanned — the
+            # equivalent of passing count=1 to sub()
+            m = find().search(content)
+            assert m, f"missing anchor: {find().pattern[:40]!r}"
+            spans.append((m.start(), m.end(), m.expand(replace)))
+        else:
+            spans.append(find_block(content, find, replace))
+    return spans
+
+def apply_edits(content, edits):
+    """
+    Splice all edits in one pass: slices plus replacements joined once.
+
+    Peak memory stays O(file) with a single output allocation, instead of a
+    fresh full-size copy per sequential replace call.
+    """
+    parts = []
+    cursor = 0
+    for start, end, replacement in sorted(edits):
+        parts.append(content[cursor:start])
+        parts.append(replacement)
+        cursor = end
+    parts.append(content[cursor:])
+    return ''.join(parts)
+
+def apply_line_edits(content, scanner):
+    """Apply all TODO line swaps via the precompiled alternation regex."""
+    pattern, dispatch = scanner
+    return pattern.sub(lambda m: dispatch[m.lastgroup], content)
+
+def needs_integration(path, sentinel):
+    """
+    Scan for the sentinel over an mmap of the raw bytes.
+
+    The repeat-run fast path never decodes the file: the search runs on
+    the page cache directly, touching only the bytes it needs, and the
+    2-4x wide str copy is only built when edits actually apply.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return True
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(sentinel.encode('utf-8')) < 0
+
+def main():
+    # Collect per-handler status and flush it in one stdout write at the
+    # end: one write(2) syscall instead of one per print in unbuffered CI
+    status = []
+    for path, sentinel, scanner, edits in HANDLERS:
+        p = repo_root() / path
+        if not needs_integration(p, sentinel):
+            status.append(f"✅ {p.name} already integrated; skipping")
+            continue
+        orig = p.read_text(encoding='utf-8')
+        content = apply_line_edits(orig, scanner)
+        content = apply_edits(content, collect_edits(content, edits))
+        if content == orig:
+            # Equality short-circuits on length mismatch, so the check is
+            # essentially free — and skipping the write keeps the mtime
+            # stable, sparing the Go toolchain a rebuild of the handler
+            status.append(f"✅ {p.name} unchanged; nothing written")
+            continue
+        p.write_text(content, encoding='utf-8')
+        status.append(f"✅ Integrated Scope 1 and Scope 3 calculators into {p.name}")
+    sys.stdout.write('\n'.join(status) + '\n')
+
+if __name__ == '__main__':
+    main()